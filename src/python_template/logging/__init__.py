@@ -1,23 +1,51 @@
-"""logging"""
+"""logging
+
+Best Practices
+--------------
+Pass arguments to the logging methods instead of formatting the message in
+advance, so that suppressed records are never formatted.
+
+>>> _logger = get_child_logger(__name__)
+>>> _logger.debug("value=%r", value)  # good
+>>> _logger.debug(f"value={value!r}")  # formatted even if DEBUG is disabled
+
+If building the arguments themselves is expensive, wrap them with
+`LazyFormat`, or check the level first with `debug_enabled`,
+`Logger.isEnabledFor` or `log_if_enabled`.
+
+>>> _logger.debug("x=%s", LazyFormat(lambda: compute()))
+>>> if debug_enabled(_logger):
+>>>     _logger.debug("x=%s", compute())
+"""
 
 from logging import CRITICAL, DEBUG, ERROR, INFO, NOTSET, WARNING
 
 from ._logging import (
+    BackgroundHandler,
+    LazyFormat,
+    catch_all_handler,
     catch_default_handler,
+    debug_enabled,
     disable_default_handler,
     enable_default_handler,
     get_child_logger,
     get_handler,
     get_root_logger,
+    log_if_enabled,
 )
 
 __all__ = (
+    "BackgroundHandler",
+    "LazyFormat",
+    "catch_all_handler",
     "catch_default_handler",
+    "debug_enabled",
     "disable_default_handler",
     "enable_default_handler",
     "get_child_logger",
     "get_handler",
     "get_root_logger",
+    "log_if_enabled",
     "CRITICAL",
     "DEBUG",
     "ERROR",
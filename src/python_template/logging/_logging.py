@@ -1,44 +1,399 @@
-import importlib.util
+import functools
 import os
-import re
 import sys
+import threading
+import time
+import weakref
 from logging import (
+    CRITICAL,
+    DEBUG,
+    ERROR,
     INFO,
     NOTSET,
+    FileHandler,
     Formatter,
     Handler,
     Logger,
+    LogRecord,
+    NullHandler,
     StreamHandler,
     getLogger,
 )
+from logging.handlers import QueueHandler, QueueListener
+from queue import Empty, Queue
 from types import TracebackType
-from typing import Optional, TypeVar
+from typing import AbstractSet, Any, Callable, List, Optional, TypeVar
 
 HANDLER = TypeVar("HANDLER", bound=Handler)
+T = TypeVar("T")
+
+
+_color_supported_cache: Optional[bool] = None
+"""cached result of `_color_supported`
+
+if not detected yet, None
+"""
 
 
 def _color_supported() -> bool:
-    """Detection of color support."""
-    if not importlib.util.find_spec("colorlog"):
-        return False
+    """Detection of color support.
+
+    The result is detected only once and cached, so the `NO_COLOR`
+    environment variable and the TTY of stderr are read on the first call
+    only. Call `_reset_color_cache` to detect again.
+    """
+    global _color_supported_cache
+
+    if _color_supported_cache is None:
+        _color_supported_cache = _detect_color_support()
+    return _color_supported_cache
+
+
+def _reset_color_cache() -> None:
+    """reset the cached result of `_color_supported` (for tests)"""
+    global _color_supported_cache
+
+    _color_supported_cache = None
+
 
+_HAS_COLORLOG: Optional[bool] = None
+"""whether `colorlog` can be imported
+
+if not checked yet, None
+"""
+
+
+def _has_colorlog() -> bool:
+    global _HAS_COLORLOG
+
+    if _HAS_COLORLOG is None:
+        try:
+            import colorlog  # noqa: F401
+        except ImportError:
+            _HAS_COLORLOG = False
+        else:
+            _HAS_COLORLOG = True
+    return _HAS_COLORLOG
+
+
+def _detect_color_support() -> bool:
+    # cheap checks first so that colorlog is not imported needlessly.
     # NO_COLOR environment variable:
     if os.environ.get("NO_COLOR", None):
         return False
 
-    if not hasattr(sys.stderr, "isatty") or not sys.stderr.isatty():
+    isatty = getattr(sys.stderr, "isatty", None)
+    if not (isatty and isatty()):
         return False
-    else:
-        return True
 
+    return _has_colorlog()
+
+
+_BATCH_SIZE = 256
+"""maximum number of records written at once by the background thread"""
+
+
+def _is_plain_stream_handler(handler: Handler) -> bool:
+    """whether `handler` emits records with `StreamHandler.emit` as is"""
+    return isinstance(handler, StreamHandler) and type(handler).emit in (
+        StreamHandler.emit,
+        FileHandler.emit,
+    )
+
+
+class _BatchQueueListener(QueueListener):
+    """QueueListener which writes queued records in batches
+
+    For stream handlers which do not override `emit`, all records pending in
+    the queue (up to `_BATCH_SIZE`) are formatted and written with a single
+    `write` and `flush` call.
+    """
+
+    def _monitor(self) -> None:
+        q = self.queue
+        while True:
+            records = [self.dequeue(True)]
+            while len(records) < _BATCH_SIZE:
+                try:
+                    records.append(self.dequeue(False))
+                except Empty:
+                    break
+
+            n_dequeued = len(records)
+            stop = any(record is self._sentinel for record in records)
+            records = [
+                record for record in records if record is not self._sentinel
+            ]
+            try:
+                self.handle_batch(records)
+            except Exception:
+                # keep the thread alive; report to the handlers instead.
+                for handler in self.handlers:
+                    handler.handleError(records[-1])
+            finally:
+                for _ in range(n_dequeued):
+                    q.task_done()
+            if stop:
+                break
+
+    def handle_batch(self, records: "List[LogRecord]") -> None:
+        for handler in self.handlers:
+            if _is_plain_stream_handler(handler) and (
+                getattr(handler, "stream", None) is not None
+            ):
+                self._emit_batch(handler, records)
+            else:
+                for record in records:
+                    if record.levelno >= handler.level:
+                        try:
+                            handler.handle(record)
+                        except Exception:
+                            # e.g. a filter raised
+                            handler.handleError(record)
+
+    @staticmethod
+    def _emit_batch(
+        handler: StreamHandler, records: "List[LogRecord]"
+    ) -> None:
+        handler.acquire()
+        try:
+            messages = []
+            for record in records:
+                if record.levelno < handler.level:
+                    continue
+                try:
+                    result = handler.filter(record)
+                    if not result:
+                        continue
+                    if isinstance(result, LogRecord):
+                        record = result
+                    messages.append(
+                        handler.format(record) + handler.terminator
+                    )
+                except Exception:
+                    handler.handleError(record)
+
+            if messages:
+                try:
+                    handler.stream.write("".join(messages))
+                    handler.flush()
+                except Exception:
+                    handler.handleError(records[-1])
+        finally:
+            handler.release()
+
+
+class BackgroundHandler(QueueHandler):
+    """wrap a handler so that records are emitted on a background thread
+
+    The caller thread only merges the message with its arguments (as
+    `QueueHandler` does) and enqueues the record; the final formatting by the
+    wrapped handler and the write are done on a dedicated thread, which is
+    started lazily on the first record. Records of a `StreamHandler` (or
+    `FileHandler`) which pile up in the queue are written at once.
+
+    If the background thread is not available (after `close`, or if it has
+    died), records are emitted synchronously on the caller thread, as are
+    records logged on the background thread itself (e.g. by a filter).
+    Closing this handler also closes the wrapped handler. The thread is
+    stopped before `os.fork` and started again on the next record, both in
+    the parent and in the child.
+
+    Parameters
+    ----------
+    handler : Handler
+        handler that actually emits records
+    queue_size : int, optional
+        maximum number of pending records. If the queue is full, the caller
+        blocks until there is space. If <= 0, the queue is unbounded,
+        by default 0
+    blocking_levels : AbstractSet[int], optional
+        levels which wait until the record is emitted,
+        by default {ERROR, CRITICAL}
+
+    Example
+    -------
+    >>> handler = BackgroundHandler(get_handler(FileHandler("log.txt")))
+    >>> get_root_logger().addHandler(handler)
+
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        queue_size: int = 0,
+        blocking_levels: AbstractSet[int] = frozenset((ERROR, CRITICAL)),
+    ) -> None:
+        super().__init__(Queue(queue_size))
+        self.handler = handler
+        self.queue_size = queue_size
+        self.blocking_levels = blocking_levels
+        # records below the level of the wrapped handler are never enqueued.
+        self.setLevel(handler.level)
+
+        self._listener: Optional[QueueListener] = None
+        self._listener_lock = threading.Lock()
+        self._closed = False
+        _background_handlers.add(self)
+
+    def _is_alive(self) -> bool:
+        """whether the background thread is running"""
+        listener = self._listener
+        if listener is None:
+            return False
+        thread = listener._thread
+        return thread is not None and thread.is_alive()
+
+    def _on_listener_thread(self) -> bool:
+        """whether the caller is the background thread"""
+        listener = self._listener
+        return (
+            listener is not None
+            and listener._thread is threading.current_thread()
+        )
+
+    def _start(self) -> None:
+        with self._listener_lock:
+            if self._listener is None and not self._closed:
+                self._listener = _BatchQueueListener(
+                    self.queue, self.handler, respect_handler_level=True
+                )
+                self._listener.start()
+
+    def _join(self) -> None:
+        """wait until all queued records are handled
+
+        Unlike `Queue.join`, this returns if the background thread dies.
+        """
+        q = self.queue
+        with q.all_tasks_done:
+            while q.unfinished_tasks and self._is_alive():
+                q.all_tasks_done.wait(0.1)
+
+    def _drain(self) -> None:
+        """emit the records left in the queue on the caller thread"""
+        while True:
+            try:
+                record = self.queue.get_nowait()
+            except Empty:
+                break
+            try:
+                if record is not None:
+                    self.handler.handle(record)
+            finally:
+                self.queue.task_done()
+
+    def _stop(self) -> None:
+        """stop the background thread (with `_listener_lock` held)"""
+        if self._listener is not None:
+            # drain first so that the sentinel fits in a bounded queue.
+            self._join()
+            if self._is_alive():
+                self._listener.stop()
+            self._listener = None
+        self._drain()
+
+    def enqueue(self, record: LogRecord) -> None:
+        # block instead of dropping the record when the queue is full.
+        self.queue.put(record)
+
+    def emit(self, record: LogRecord) -> None:
+        if self._listener is None:
+            self._start()
+        if self._on_listener_thread():
+            # logged while handling a record (e.g. by a filter). Waiting for
+            # the queue here would wait for this very thread.
+            self.handler.handle(record)
+            return
+        if not self._is_alive():
+            # the thread has been stopped (e.g. at interpreter exit) or has
+            # died. Emit the pending records and this one synchronously.
+            self._drain()
+            self.handler.handle(record)
+            return
+
+        super().emit(record)
+        if record.levelno in self.blocking_levels:
+            self.flush()
+
+    def flush(self) -> None:
+        """wait until all queued records are emitted"""
+        self._join()
+        if not self._is_alive():
+            self._drain()
+        self.handler.flush()
+
+    def close(self) -> None:
+        """stop the background thread after emitting all queued records
+
+        The wrapped handler is closed as well.
+        """
+        with self._listener_lock:
+            self._stop()
+            self._closed = True
+        _background_handlers.discard(self)
+        self.handler.close()
+        super().close()
+
+    def _before_fork(self) -> None:
+        # a thread cannot be carried over to the child, so stop it here. The
+        # lock is held until the fork completes so that no thread restarts it.
+        self._listener_lock.acquire()
+        self._stop()
+
+    def _after_fork_in_parent(self) -> None:
+        self._listener_lock.release()
+
+    def _after_fork_in_child(self) -> None:
+        self._listener_lock = threading.Lock()
+        self.queue = Queue(self.queue_size)
+
+
+_background_handlers: "weakref.WeakSet[BackgroundHandler]" = weakref.WeakSet()
+"""living `BackgroundHandler` instances"""
+
+
+_forking_handlers: "List[BackgroundHandler]" = []
+"""`BackgroundHandler` instances prepared for the ongoing fork"""
+
+
+def _before_fork() -> None:
+    _forking_handlers[:] = list(_background_handlers)
+    for handler in _forking_handlers:
+        handler._before_fork()
+
+
+def _after_fork_in_parent() -> None:
+    for handler in _forking_handlers:
+        handler._after_fork_in_parent()
+    _forking_handlers.clear()
+
+
+def _after_fork_in_child() -> None:
+    for handler in _forking_handlers:
+        handler._after_fork_in_child()
+    _forking_handlers.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
 
-_default_handler: Optional[StreamHandler] = None
+
+_default_handler: Optional[Handler] = None
 """default root logger handler
 
 if not configured, None
 """
 
 
+_ROOT_LOGGER_NAME = __name__.split(".", 1)[0]
+"""root logger name (library name)"""
+
+
 def _get_root_logger_name() -> str:
     """get root logger name (library name)
 
@@ -47,31 +402,174 @@ def _get_root_logger_name() -> str:
     str
         root logger name (library name)
     """
-    return __name__.split(".")[0]
+    return _ROOT_LOGGER_NAME
+
+
+_root_logger: Logger = getLogger(_ROOT_LOGGER_NAME)
+"""library root logger
+
+`getLogger` takes the module lock, so the reference is kept here.
+"""
+
+
+_FORMAT = "%(asctime)s - %(name)s:%(lineno)d[%(levelname)s] - %(message)s"
+_COLOR_FORMAT = (
+    "%(asctime)s - %(name)s:%(lineno)d"
+    "%(log_color)s[%(levelname)s]%(reset)s - %(message)s"
+)
+_COMPACT_FORMAT = "%(levelname).1s %(name)s:%(lineno)d %(message)s"
+_COMPACT_COLOR_FORMAT = (
+    "%(log_color)s%(levelname).1s%(reset)s %(name)s:%(lineno)d %(message)s"
+)
+_COMPACT_ENV = "PYTHON_TEMPLATE_LOG_COMPACT"
+"""if set, the compact format (without time) is used by default"""
 
 
-def create_default_formatter() -> Formatter:
+class _Formatter(Formatter):
+    """Formatter which reuses the formatted time within the same second
+
+    `time.localtime` and `time.strftime` are called only for the first
+    record of each second.
+    """
+
+    _time_cache: "Optional[tuple[int, Optional[str], str]]" = None
+
+    def formatTime(
+        self, record: LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        second = int(record.created)
+        cache = self._time_cache
+        if cache is not None and cache[0] == second and cache[1] == datefmt:
+            s = cache[2]
+        else:
+            s = time.strftime(
+                datefmt if datefmt else self.default_time_format,
+                self.converter(record.created),
+            )
+            # a single assignment so that other threads never see a torn cache
+            self._time_cache = (second, datefmt, s)
+
+        if not datefmt and self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
+        return s
+
+
+def create_default_formatter(
+    use_color: Optional[bool] = None, fmt: Optional[str] = None
+) -> Formatter:
     """create default formatter
 
+    The same instance is returned for the same format and color setting.
+
+    Parameters
+    ----------
+    use_color : Optional[bool], optional
+        use colored formatter or not. If None, colored formatter is used when
+        it is supported. Even if True, colored formatter is not used when it
+        is not supported, by default None
+    fmt : Optional[str], optional
+        format string. If None, the default format is used, or the compact
+        one without time if the environment variable
+        `PYTHON_TEMPLATE_LOG_COMPACT` is set, by default None
+
     Returns
     -------
     Formatter
         default formatter
     """
-    if _color_supported():
+    compact = bool(os.environ.get(_COMPACT_ENV, None))
+    colored = use_color is not False and _color_supported()
+    if fmt is None:
+        if colored:
+            fmt = _COMPACT_COLOR_FORMAT if compact else _COLOR_FORMAT
+        else:
+            fmt = _COMPACT_FORMAT if compact else _FORMAT
+    return _get_formatter(fmt, colored)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_formatter(fmt: str, colored: bool) -> Formatter:
+    """get formatter shared by all handlers with the same format
+
+    Formatters are safe to be shared between handlers and threads.
+    """
+    if colored:
         from colorlog import ColoredFormatter
 
-        return ColoredFormatter(
-            "%(asctime)s - %(name)s:%(lineno)d%(log_color)s[%(levelname)s]%(reset)s - %(message)s"
-        )
+        class _ColoredFormatter(_Formatter, ColoredFormatter):
+            pass
+
+        return _ColoredFormatter(fmt)
     else:
-        return Formatter(
-            "%(asctime)s - %(name)s:%(lineno)d[%(levelname)s] - %(message)s"
-        )
+        return _Formatter(fmt)
+
+
+_df: Optional[Formatter] = None
+"""default formatter
+
+if not created yet, None. Access it as `default_formatter`.
+"""
+
+
+def _get_default_formatter() -> Formatter:
+    global _df
+
+    if _df is None:
+        _df = create_default_formatter()
+    return _df
+
+
+def __getattr__(name: str) -> Any:
+    # create `default_formatter` lazily (PEP 562) to avoid detecting color
+    # support on import.
+    if name == "default_formatter":
+        return _get_default_formatter()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_plain_formatter: Optional[Formatter] = None
+"""default formatter without color (for files)
+
+if not created yet, None. Created lazily like `default_formatter`, so that
+both read `PYTHON_TEMPLATE_LOG_COMPACT` at the same time.
+"""
+
+
+def _get_plain_formatter() -> Formatter:
+    global _plain_formatter
+
+    if _plain_formatter is None:
+        _plain_formatter = create_default_formatter(use_color=False)
+    return _plain_formatter
+
+
+_FormatterGetter = Callable[[], Optional[Formatter]]
+
+_FORMATTER_FOR_TYPE: "dict[type[Handler], _FormatterGetter]" = {
+    FileHandler: _get_plain_formatter,
+    StreamHandler: _get_default_formatter,
+    # the records are formatted by the handler at the other end of the queue.
+    QueueHandler: lambda: None,
+}
+"""getter of the default formatter for each handler type
+
+Subclasses are resolved by their MRO on the first lookup and then cached.
+Other handlers (e.g. `SysLogHandler`) get the formatter without color.
+"""
 
 
-default_formatter: Formatter = create_default_formatter()
-"""default formatter"""
+def _select_default_formatter(handler: Handler) -> Optional[Formatter]:
+    handler_type = type(handler)
+    get_formatter = _FORMATTER_FOR_TYPE.get(handler_type)
+    if get_formatter is None:
+        for base in handler_type.__mro__[1:]:
+            if base in _FORMATTER_FOR_TYPE:
+                get_formatter = _FORMATTER_FOR_TYPE[base]
+                break
+        else:
+            get_formatter = _FORMATTER_FOR_TYPE[FileHandler]
+        _FORMATTER_FOR_TYPE[handler_type] = get_formatter
+    return get_formatter()
 
 
 def get_handler(
@@ -79,6 +577,11 @@ def get_handler(
 ) -> HANDLER:
     """configure handler in an easy api
 
+    If `formatter` is not given, a default formatter is selected by the type
+    of `handler` (colored for console, plain for files and the others). A
+    `QueueHandler` (e.g. `BackgroundHandler`) is left without formatter,
+    because the handler it passes records to formats them.
+
     Parameters
     ----------
     handler : HANDLER
@@ -94,30 +597,62 @@ def get_handler(
 
     """
     handler.setLevel(level)
-    handler.setFormatter(
-        formatter if formatter else create_default_formatter()
-    )
+    if not formatter:
+        formatter = _select_default_formatter(handler)
+    if formatter:
+        handler.setFormatter(formatter)
     return handler
 
 
-def _create_default_handler() -> StreamHandler:
-    return get_handler(StreamHandler())
+def _create_default_handler() -> BackgroundHandler:
+    return BackgroundHandler(get_handler(StreamHandler()))
+
+
+_configured = False
+"""whether the library root logger has been configured"""
+
+_DISABLE_ENV = "PYTHON_TEMPLATE_DISABLE_LOGGING"
+"""if set, the library root logger is configured to log nothing"""
 
 
 def _configure_library_root_logger() -> None:
-    global _default_handler
+    global _configured, _default_handler
 
-    if _default_handler:
+    if _configured:
         # This library has already configured the library root logger.
         return
 
+    if os.environ.get(_DISABLE_ENV, None):
+        # skip creating the default handler and formatter entirely.
+        _default_handler = NullHandler()
+        _root_logger.addHandler(_default_handler)
+        _root_logger.setLevel(CRITICAL + 1)
+        _root_logger.propagate = False
+        _configured = True
+        return
+
     _default_handler = _create_default_handler()
 
     # Apply our default configuration to the library root logger.
-    library_root_logger = get_root_logger()
-    library_root_logger.addHandler(_default_handler)
-    library_root_logger.setLevel(INFO)
-    library_root_logger.propagate = False
+    _root_logger.addHandler(_default_handler)
+    _root_logger.setLevel(INFO)
+    _root_logger.propagate = False
+
+    _configured = True
+
+
+def _reset_library_root_logger() -> None:
+    """reset the configuration of the library root logger (for tests)"""
+    global _configured, _default_handler
+
+    _root_logger.handlers.clear()
+    _root_logger.setLevel(NOTSET)
+
+    if _default_handler is not None:
+        _default_handler.close()
+        _default_handler = None
+    _configured = False
+    _get_child_logger.cache_clear()
 
 
 def get_root_logger() -> Logger:
@@ -128,9 +663,27 @@ def get_root_logger() -> Logger:
     Logger
         library root logger
     """
-    _configure_library_root_logger()
+    if not _configured:
+        _configure_library_root_logger()
 
-    return getLogger(_get_root_logger_name())
+    return _root_logger
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_child_logger(name: str) -> Logger:
+    """resolve child logger from module name
+
+    Cached so that repeated calls with the same name skip the name parsing.
+    """
+    root_logger = get_root_logger()
+
+    prefix = _ROOT_LOGGER_NAME + "."
+    if name.startswith(prefix) and len(name) > len(prefix):
+        return root_logger.getChild(name[len(prefix) :])
+    elif name == "__main__":
+        return root_logger.getChild(name)
+    else:
+        raise ValueError("You should use '__name__'.")
 
 
 def get_child_logger(name: str, propagate: bool = True) -> Logger:
@@ -154,20 +707,94 @@ def get_child_logger(name: str, propagate: bool = True) -> Logger:
     ValueError
 
     """
-    root_logger = get_root_logger()
-
-    _result_logger = re.match(rf"{_get_root_logger_name()}\.(.+)", name)
-    if _result_logger:
-        child_logger = root_logger.getChild(_result_logger.group(1))
-    elif name == "__main__":
-        child_logger = root_logger.getChild(name)
-    else:
-        raise ValueError("You should use '__name__'.")
-
+    child_logger = _get_child_logger(name)
     child_logger.propagate = propagate
     return child_logger
 
 
+class LazyFormat:
+    """defer building a log argument until the record is formatted
+
+    Parameters
+    ----------
+    func : Callable[[], Any]
+        function which returns the value to be logged
+
+    Example
+    -------
+    >>> _logger = get_child_logger(__name__)
+    >>> _logger.debug("x=%s", LazyFormat(lambda: compute()))
+
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: "Callable[[], Any]") -> None:
+        self.func = func
+
+    def __str__(self) -> str:
+        return str(self.func())
+
+    def __repr__(self) -> str:
+        return repr(self.func())
+
+
+def debug_enabled(logger: Logger) -> bool:
+    """whether `logger` is enabled for `DEBUG`
+
+    Parameters
+    ----------
+    logger : Logger
+        logger to check
+
+    Returns
+    -------
+    bool
+        if enabled, True
+    """
+    return logger.isEnabledFor(DEBUG)
+
+
+def log_if_enabled(
+    logger: Logger, level: int
+) -> "Callable[[Callable[..., T]], Callable[..., Optional[T]]]":
+    """call the decorated function only if `logger` is enabled for `level`
+
+    Useful to skip building expensive log messages for suppressed records.
+
+    Parameters
+    ----------
+    logger : Logger
+        logger to check
+    level : int
+        logging level
+
+    Returns
+    -------
+    Callable[[Callable[..., T]], Callable[..., Optional[T]]]
+        decorator. The decorated function returns None without being called
+        when `logger` is not enabled for `level`.
+
+    Example
+    -------
+    >>> _logger = get_child_logger(__name__)
+    >>> @log_if_enabled(_logger, DEBUG)
+    >>> def log_state(state):
+    >>>     _logger.debug("state=%s", expensive_summary(state))
+    """
+
+    def decorator(func: "Callable[..., T]") -> "Callable[..., Optional[T]]":
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Optional[T]:
+            if logger.isEnabledFor(level):
+                return func(*args, **kwargs)
+            return None
+
+        return wrapper
+
+    return decorator
+
+
 def enable_default_handler() -> None:
     """enable default handler"""
     _configure_library_root_logger()
@@ -181,6 +808,8 @@ def disable_default_handler() -> None:
     _configure_library_root_logger()
 
     assert _default_handler is not None
+    # emit records logged before disabling.
+    _default_handler.flush()
     get_root_logger().removeHandler(_default_handler)
 
 
@@ -206,3 +835,36 @@ class catch_default_handler:
         traceback: Optional[TracebackType],
     ) -> None:
         enable_default_handler()
+
+
+class catch_all_handler:
+    """catch all handlers of the library root logger
+
+    Records of the library loggers are not even created in this context,
+    because the level of the library root logger is raised above `CRITICAL`.
+    Child loggers with their own level are not affected.
+
+    Example
+    -------
+    >>> _logger = get_child_logger(__name__)
+    >>> with catch_all_handler():
+    >>>    _logger.critical("not log")
+    >>> _logger.critical("log")
+
+    """
+
+    def __enter__(self) -> None:
+        self.root_logger = get_root_logger()
+        self.level = self.root_logger.level
+        if _default_handler is not None:
+            # emit records logged before entering.
+            _default_handler.flush()
+        self.root_logger.setLevel(CRITICAL + 1)
+
+    def __exit__(
+        self,
+        exc_type: "Optional[type[Exception]]",
+        exc_value: Optional[Exception],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.root_logger.setLevel(self.level)
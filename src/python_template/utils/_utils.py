@@ -1,10 +1,15 @@
 import importlib.util
 import inspect
+import sys
+import weakref
 from collections.abc import Callable, Iterable, Iterator
-from typing import Any, Generic, TypeVar
+from typing import Any, FrozenSet, Generic, TypeVar
 
 T = TypeVar("T")
 
+_is_installed_cache: "dict[str, bool]" = {}
+"""cached results of `is_installed`"""
+
 
 def is_installed(package_name: str) -> bool:
     """Check if the package is installed.
@@ -18,8 +23,25 @@ def is_installed(package_name: str) -> bool:
     -------
     bool
         if installed, True
+
+    Notes
+    -----
+    The result is cached for each package name.
     """
-    return bool(importlib.util.find_spec(package_name))
+    installed = _is_installed_cache.get(package_name)
+    if installed is None:
+        # `sys.modules[name] = None` blocks the import; `find_spec` returns
+        # None for it, so it is not regarded as installed.
+        installed = sys.modules.get(package_name) is not None or bool(
+            importlib.util.find_spec(package_name)
+        )
+        _is_installed_cache[package_name] = installed
+    return installed
+
+
+def _is_installed_cache_clear() -> None:
+    """clear the cached results of `is_installed` (for tests)"""
+    _is_installed_cache.clear()
 
 
 def is_argument(__callable: "Callable[..., Any]", arg_name: str) -> bool:
@@ -37,7 +59,31 @@ def is_argument(__callable: "Callable[..., Any]", arg_name: str) -> bool:
     bool
         if included, True
     """
-    return arg_name in set(inspect.signature(__callable).parameters.keys())
+    if inspect.isfunction(__callable) or inspect.isclass(__callable):
+        return arg_name in _get_parameter_names(__callable)
+    else:
+        # not cached: bound methods and callable instances cannot be weakly
+        # referenced (or die with their objects), and may be unhashable.
+        return arg_name in inspect.signature(__callable).parameters
+
+
+_parameter_names_cache: "weakref.WeakKeyDictionary[Any, FrozenSet[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+"""cached parameter names of functions and classes
+
+Weakly keyed so that the cache does not keep them (and their closures)
+alive. Only the names are stored, which never refer back to the key.
+"""
+
+
+def _get_parameter_names(__callable: "Callable[..., Any]") -> FrozenSet[str]:
+    """get parameter names of the function or class (cached)"""
+    parameter_names = _parameter_names_cache.get(__callable)
+    if parameter_names is None:
+        parameter_names = frozenset(inspect.signature(__callable).parameters)
+        _parameter_names_cache[__callable] = parameter_names
+    return parameter_names
 
 
 # HACK: when drop python3.8, use `dummy_tqdm(Iterable[T])`
@@ -57,6 +103,9 @@ class dummy_tqdm(Iterable, Generic[T]):
         return iter(self.__iterable)
 
     def __getattr__(self, name: str) -> "Callable[..., None]":
+        # store it so that next lookups (e.g. `pbar.update(1)` in a loop) do
+        # not go through `__getattr__`.
+        setattr(self, name, self.__no_operation)
         return self.__no_operation
 
     @staticmethod
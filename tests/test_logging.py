@@ -0,0 +1,424 @@
+import io
+import logging
+import logging.handlers
+import os
+import signal
+import threading
+import warnings
+
+import pytest
+
+from python_template.logging import (
+    DEBUG,
+    ERROR,
+    INFO,
+    BackgroundHandler,
+    catch_default_handler,
+    get_child_logger,
+    get_handler,
+)
+
+
+@pytest.fixture
+def background_logger(request, tmp_path):
+    """logger with a `BackgroundHandler` only
+
+    Yields `(logger, handler, stream)`. The wrapped handler writes bare
+    messages to a `StringIO`, or to `tmp_path / "log.txt"` (then `stream` is
+    the path) when parametrized indirectly with "file".
+    """
+    if getattr(request, "param", None) == "file":
+        stream = tmp_path / "log.txt"
+        inner = logging.FileHandler(stream)
+    else:
+        stream = io.StringIO()
+        inner = logging.StreamHandler(stream)
+    handler = BackgroundHandler(get_handler(inner, logging.Formatter()))
+
+    logger = logging.getLogger(f"tests.{request.node.name}")
+    logger.setLevel(DEBUG)
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        yield logger, handler, stream
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_background_handler(background_logger):
+    logger, handler, stream = background_logger
+    handler.setLevel(INFO)
+
+    logger.debug("not log")
+    logger.info("log %d", 1)
+    handler.flush()
+    assert stream.getvalue() == "log 1\n"
+
+    # blocking levels are emitted before returning to the caller.
+    logger.log(ERROR, "error")
+    assert stream.getvalue() == "log 1\nerror\n"
+
+    # after closing, records are emitted synchronously.
+    handler.close()
+    logger.info("closed")
+    assert stream.getvalue().endswith("closed\n")
+
+
+def _log_error_in_thread(logger, msg):
+    """log `msg` at ERROR and return whether the call returned"""
+    thread = threading.Thread(target=logger.error, args=(msg,), daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    return not thread.is_alive()
+
+
+@pytest.mark.filterwarnings(
+    "ignore::pytest.PytestUnhandledThreadExceptionWarning"
+)
+def test_background_handler_dead_thread(background_logger):
+    logger, handler, stream = background_logger
+
+    def killing_filter(record):
+        if record.getMessage() == "kill":
+            # not caught by the background thread, which then dies.
+            raise SystemExit
+        return True
+
+    handler.handler.addFilter(killing_filter)
+    logger.info("kill")
+    handler._listener._thread.join(timeout=5)
+    assert not handler._is_alive()
+    assert _log_error_in_thread(logger, "after")
+    assert stream.getvalue() == "after\n"
+
+
+def test_background_handler_raising_filter(background_logger):
+    logger, handler, stream = background_logger
+    errors = []
+    handler.handler.handleError = errors.append
+
+    def broken_filter(record):
+        if record.getMessage() == "broken":
+            raise RuntimeError("broken filter")
+        return True
+
+    handler.handler.addFilter(broken_filter)
+    logger.info("before")
+    logger.info("broken")
+    logger.info("after")
+    handler.flush()
+    # the error is reported and the background thread keeps running.
+    assert [record.getMessage() for record in errors] == ["broken"]
+    assert handler._is_alive()
+    assert _log_error_in_thread(logger, "error")
+    assert stream.getvalue().splitlines() == ["before", "after", "error"]
+
+
+def test_background_handler_log_in_filter(background_logger):
+    logger, handler, stream = background_logger
+
+    def logging_filter(record):
+        if record.getMessage() == "trigger":
+            # runs on the background thread
+            logger.error("from filter")
+        return True
+
+    handler.handler.addFilter(logging_filter)
+    logger.info("trigger")
+    thread = threading.Thread(target=handler.flush, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert stream.getvalue().splitlines() == ["from filter", "trigger"]
+
+
+def test_background_handler_close(tmp_path):
+    inner = logging.FileHandler(tmp_path / "log.txt")
+    handler = BackgroundHandler(inner)
+    handler.handle(logging.makeLogRecord({"msg": "x"}))
+    handler.close()
+    assert inner.stream is None
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.parametrize("background_logger", ["file"], indirect=True)
+def test_background_handler_fork(background_logger):
+    logger, handler, path = background_logger
+    logger.info("parent before fork")
+    handler.flush()
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        pid = os.fork()
+        if pid == 0:  # child
+            status = 1
+            try:
+                signal.alarm(5)
+                logger.info("child info")
+                logger.error("child error")
+                handler.close()
+                status = 0
+            finally:
+                os._exit(status)
+    assert not [w for w in caught if "fork" in str(w.message).lower()], (
+        "the background thread is alive at fork"
+    )
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+    logger.info("parent after fork")
+    handler.flush()
+    assert sorted(path.read_text().splitlines()) == [
+        "child error",
+        "child info",
+        "parent after fork",
+        "parent before fork",
+    ]
+
+
+def test_background_handler_batch(background_logger):
+    logger, handler, _ = background_logger
+    released = threading.Event()
+
+    class CountingStream(io.StringIO):
+        n_write = 0
+
+        def write(self, s):
+            # hold the background thread so that records pile up.
+            released.wait()
+            self.n_write += 1
+            return super().write(s)
+
+    stream = CountingStream()
+    handler.handler.setStream(stream)
+    for i in range(1000):
+        logger.info("log %d", i)
+    released.set()
+    handler.flush()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1000
+    assert lines[-1] == "log 999"
+    # 1 record + 999 records in batches of 256
+    assert stream.n_write <= 5
+
+
+def test_catch_default_handler():
+    from python_template.logging import _logging
+
+    stream = io.StringIO()
+    _logger = get_child_logger("python_template.tests")
+    assert isinstance(_logging._default_handler, BackgroundHandler)
+    inner = _logging._default_handler.handler
+    assert isinstance(inner, logging.StreamHandler)
+    original_stream = inner.setStream(stream)
+    try:
+        _logger.info("before")
+        with catch_default_handler():
+            assert "before" in stream.getvalue()
+            _logger.info("not log")
+        _logger.error("log")
+    finally:
+        inner.setStream(original_stream)
+
+    assert "not log" not in stream.getvalue()
+    assert "log" in stream.getvalue()
+
+
+def test_get_child_logger():
+    from python_template.logging import _logging
+
+    _logger = get_child_logger("python_template.tests", propagate=False)
+    assert _logger.name == "python_template.tests"
+    assert not _logger.propagate
+    assert get_child_logger("python_template.tests") is _logger
+    assert _logger.propagate
+
+    _logging._reset_library_root_logger()
+    assert _logging._get_child_logger.cache_info().currsize == 0
+    assert get_child_logger("python_template.tests") is _logger
+    assert _logging._default_handler is not None
+
+
+def test_get_handler_formatter(tmp_path):
+    from logging.handlers import RotatingFileHandler
+
+    from python_template.logging import _logging
+
+    handler = get_handler(RotatingFileHandler(tmp_path / "log.txt"))
+    try:
+        assert handler.formatter is _logging._get_plain_formatter()
+    finally:
+        handler.close()
+
+    handler = get_handler(logging.StreamHandler())
+    assert handler.formatter is _logging.default_formatter
+
+    formatter = logging.Formatter()
+    handler = get_handler(logging.StreamHandler(), formatter=formatter)
+    assert handler.formatter is formatter
+
+    # other handlers get the formatter without color
+    handler = get_handler(logging.handlers.MemoryHandler(1))
+    assert handler.formatter is _logging._get_plain_formatter()
+
+    # records are formatted only once, by the wrapped handler
+    stream = io.StringIO()
+    handler = get_handler(
+        BackgroundHandler(get_handler(logging.StreamHandler(stream)))
+    )
+    try:
+        assert handler.formatter is None
+        handler.handle(logging.makeLogRecord({"msg": "hello", "levelno": 40}))
+    finally:
+        handler.close()
+    assert stream.getvalue().count(" - ") == 2
+    assert stream.getvalue().endswith(" - hello\n")
+
+
+def test_log_if_enabled():
+    from python_template.logging import log_if_enabled
+
+    _logger = logging.getLogger("test_log_if_enabled")
+    _logger.setLevel(INFO)
+
+    @log_if_enabled(_logger, DEBUG)
+    def debug_func():
+        return "called"
+
+    @log_if_enabled(_logger, INFO)
+    def info_func():
+        return "called"
+
+    assert debug_func() is None
+    assert info_func() == "called"
+
+
+def test_catch_all_handler():
+    from python_template.logging import catch_all_handler, get_root_logger
+
+    stream = io.StringIO()
+    handler = get_handler(logging.StreamHandler(stream))
+    root_logger = get_root_logger()
+    root_logger.addHandler(handler)
+    level = root_logger.level
+    try:
+        _logger = get_child_logger("python_template.tests")
+        with catch_all_handler():
+            assert not _logger.isEnabledFor(logging.CRITICAL)
+            _logger.critical("not log")
+        assert root_logger.level == level
+        _logger.critical("log")
+    finally:
+        root_logger.removeHandler(handler)
+
+    assert "not log" not in stream.getvalue()
+    assert "log" in stream.getvalue()
+
+
+def test_color_supported(monkeypatch):
+    from python_template.logging import _logging
+
+    _logging._reset_color_cache()
+    try:
+        monkeypatch.setenv("NO_COLOR", "1")
+        assert not _logging._color_supported()
+
+        # cached
+        monkeypatch.delenv("NO_COLOR")
+        monkeypatch.setattr(_logging, "_detect_color_support", lambda: True)
+        assert not _logging._color_supported()
+
+        _logging._reset_color_cache()
+        assert _logging._color_supported()
+    finally:
+        _logging._reset_color_cache()
+
+
+def test_get_child_logger_invalid_name():
+    for name in ("python_template", "python_template.", "other.module"):
+        with pytest.raises(ValueError):
+            get_child_logger(name)
+    assert get_child_logger("__main__").name == "python_template.__main__"
+
+
+def test_lazy_format():
+    from python_template.logging import LazyFormat, debug_enabled
+
+    calls = []
+
+    def compute():
+        calls.append(None)
+        return 42
+
+    stream = io.StringIO()
+    _logger = logging.getLogger("test_lazy_format")
+    _logger.setLevel(INFO)
+    _logger.propagate = False
+    _logger.addHandler(logging.StreamHandler(stream))
+    try:
+        assert not debug_enabled(_logger)
+        _logger.debug("x=%s", LazyFormat(compute))
+        assert not calls
+
+        _logger.info("x=%s", LazyFormat(compute))
+        assert calls
+        assert stream.getvalue() == "x=42\n"
+    finally:
+        _logger.handlers.clear()
+
+
+def test_default_formatter_time():
+    from python_template.logging._logging import create_default_formatter
+
+    formatter = create_default_formatter(use_color=False)
+    reference = logging.Formatter("%(asctime)s")
+    for created in (1700000000.25, 1700000000.75, 1700000001.5):
+        record = logging.makeLogRecord({"msg": "x", "created": created})
+        record.msecs = (created - int(created)) * 1000
+        assert formatter.formatTime(record) == reference.formatTime(record)
+        assert formatter.formatTime(record, "%Y") == reference.formatTime(
+            record, "%Y"
+        )
+
+
+def test_default_formatter_compact(monkeypatch):
+    from python_template.logging import _logging
+    from python_template.logging._logging import create_default_formatter
+
+    record = logging.makeLogRecord({"msg": "x", "levelname": "INFO"})
+    monkeypatch.setenv("PYTHON_TEMPLATE_LOG_COMPACT", "1")
+    formatter = create_default_formatter(use_color=False)
+    assert not formatter.usesTime()
+    assert formatter.format(record).startswith("I ")
+
+    formatter = create_default_formatter(use_color=False, fmt="%(message)s")
+    assert formatter.format(record) == "x"
+    assert (
+        create_default_formatter(use_color=False, fmt="%(message)s")
+        is formatter
+    )
+
+    # the variable is read on first use, for files and consoles alike
+    monkeypatch.setattr(_logging, "_df", None)
+    monkeypatch.setattr(_logging, "_plain_formatter", None)
+    monkeypatch.setattr(_logging, "_color_supported_cache", False)
+    assert not _logging._get_plain_formatter().usesTime()
+    assert not _logging._get_default_formatter().usesTime()
+
+
+def test_disable_logging_env(monkeypatch):
+    from python_template.logging import _logging, get_root_logger
+
+    monkeypatch.setenv("PYTHON_TEMPLATE_DISABLE_LOGGING", "1")
+    _logging._reset_library_root_logger()
+    try:
+        _logger = get_child_logger("python_template.tests")
+        assert not _logger.isEnabledFor(logging.CRITICAL)
+        assert isinstance(_logging._default_handler, logging.NullHandler)
+        assert get_root_logger().handlers == [_logging._default_handler]
+    finally:
+        monkeypatch.delenv("PYTHON_TEMPLATE_DISABLE_LOGGING")
+        _logging._reset_library_root_logger()
@@ -0,0 +1,84 @@
+import gc
+import sys
+import weakref
+
+import pytest
+
+from python_template.utils import is_argument
+
+
+def test_is_argument():
+    def func(a, b=1, *args, c, **kwargs):
+        pass
+
+    for arg_name in ("a", "b", "args", "c", "kwargs"):
+        assert is_argument(func, arg_name)
+    assert not is_argument(func, "d")
+
+    class Unhashable:
+        __hash__ = None
+
+        def __call__(self, x):
+            pass
+
+    assert is_argument(Unhashable(), "x")
+    assert not is_argument(Unhashable(), "y")
+
+    class Klass:
+        def method(self, a):
+            pass
+
+    assert not is_argument(Klass, "self")
+    obj = Klass()
+    assert is_argument(obj.method, "a")
+    assert not is_argument(obj.method, "self")
+
+    # the bound method must not keep the instance alive
+    ref = weakref.ref(obj)
+    del obj
+    gc.collect()
+    assert ref() is None
+
+    # the cache must not keep functions (and their closures) alive
+    captured = Klass()
+    ref = weakref.ref(captured)
+
+    def closure(x):
+        return captured
+
+    assert is_argument(closure, "x")
+    del captured, closure
+    gc.collect()
+    assert ref() is None
+
+    with pytest.raises(TypeError):
+        is_argument(1, "a")  # type: ignore[arg-type]
+
+
+def test_dummy_tqdm():
+    from python_template.utils import dummy_tqdm
+
+    pbar = dummy_tqdm(range(3), desc="test")
+    assert list(pbar) == [0, 1, 2]
+    assert pbar.update(1) is None
+    assert pbar.set_description("test", refresh=True) is None
+    assert "update" in vars(pbar)
+
+
+def test_is_installed(monkeypatch):
+    from python_template.utils import _utils, is_installed
+
+    _utils._is_installed_cache_clear()
+    try:
+        assert is_installed("pytest")
+        assert is_installed("python_template")
+        assert not is_installed("python_template_not_installed")
+        assert _utils._is_installed_cache["pytest"]
+        _utils._is_installed_cache_clear()
+        assert not _utils._is_installed_cache
+
+        # `None` in sys.modules blocks the import
+        monkeypatch.setitem(sys.modules, "pytest", None)
+        assert not is_installed("pytest")
+    finally:
+        _utils._is_installed_cache_clear()